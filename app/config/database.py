@@ -7,32 +7,49 @@ Requires:
   - certifi            (for Atlas TLS CA bundle)
 """
 import asyncio
+import logging
 import os
+import random
+import weakref
 from urllib.parse import urlparse
 
 import certifi
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.errors import (
+    AutoReconnect,
+    ConfigurationError,
+    OperationFailure,
+    ServerSelectionTimeoutError,
+)
 
-_client: AsyncIOMotorClient | None = None
-_db: AsyncIOMotorDatabase | None = None
+logger = logging.getLogger(__name__)
 
-# Retry settings for first connection (Render cold‑start can be slow)
-_MAX_RETRIES = 3
-_RETRY_DELAY_S = 2
+# Retry settings for first connection (Render cold‑start can be slow).
+# Delays grow exponentially (~1+2+4+8 s) with random jitter so replicas
+# restarting together don't retry against Atlas in lock-step.
+_MAX_RETRIES = 5
+_BASE_DELAY_S = 1.0
+_MAX_DELAY_S = 30.0
+_JITTER = 0.5
 
 
-async def connect_db() -> None:
-    global _client, _db
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to wait after the given (1-based) failed attempt."""
+    delay = _BASE_DELAY_S * (2 ** (attempt - 1)) * (1 + random.random() * _JITTER)
+    return min(_MAX_DELAY_S, delay)
+
 
+async def _open_client() -> tuple[AsyncIOMotorClient, AsyncIOMotorDatabase]:
+    """Create a Motor client for the running loop and ping it with retries."""
     mongo_uri = os.getenv(
         "MONGODB_URI", "mongodb://localhost:27017/resume_builder"
     )
     # Mask credentials in log output
-    print(f"Connecting to MongoDB... (uri starts with {mongo_uri[:25]}...)")
+    logger.info("Connecting to MongoDB... (uri starts with %s...)", mongo_uri[:25])
 
     # Use certifi CA bundle so MongoDB Atlas TLS works on all platforms.
     # serverSelectionTimeoutMS keeps startup from hanging forever.
-    _client = AsyncIOMotorClient(
+    client = AsyncIOMotorClient(
         mongo_uri,
         tlsCAFile=certifi.where(),
         serverSelectionTimeoutMS=10_000,
@@ -43,31 +60,144 @@ async def connect_db() -> None:
     db_name = parsed.path.lstrip("/").split("?")[0] or "resume_builder"
 
     # Ping with retries – transient DNS / TLS errors are common on
-    # Render’s free tier during cold starts.
+    # Render’s free tier during cold starts.  Bad credentials or a malformed
+    # URI will never succeed, so those fail fast instead of being retried.
     last_err: Exception | None = None
     for attempt in range(1, _MAX_RETRIES + 1):
         try:
-            await _client.admin.command("ping")
-            _db = _client[db_name]
-            print(f"MongoDB connected successfully (attempt {attempt})")
-            return
-        except Exception as exc:
+            await client.admin.command("ping")
+            logger.info("MongoDB connected successfully (attempt %d)", attempt)
+            return client, client[db_name]
+        except (ConfigurationError, OperationFailure) as exc:
+            client.close()
+            raise RuntimeError(f"MongoDB configuration/auth error: {exc}") from exc
+        except (ServerSelectionTimeoutError, AutoReconnect) as exc:
             last_err = exc
-            print(f"MongoDB ping attempt {attempt}/{_MAX_RETRIES} failed: {exc}")
+            logger.warning(
+                "MongoDB ping attempt %d/%d failed: %s", attempt, _MAX_RETRIES, exc
+            )
             if attempt < _MAX_RETRIES:
-                await asyncio.sleep(_RETRY_DELAY_S)
+                await asyncio.sleep(_backoff_delay(attempt))
 
     # All retries exhausted – raise so lifespan logs the traceback
+    client.close()
     raise RuntimeError(
         f"Could not connect to MongoDB after {_MAX_RETRIES} attempts: {last_err}"
     )
 
 
+# Whether the unique index on users.email is known to exist.  register only
+# relies on DuplicateKeyError once this is True; until then it also checks
+# for an existing user first.
+_email_index_ok = False
+
+
+def email_index_ready() -> bool:
+    return _email_index_ok
+
+
+async def _ensure_indexes(db: AsyncIOMotorDatabase) -> None:
+    """Create the indexes the routes rely on (no-op if they already exist)."""
+    global _email_index_ok
+    # Unique email also guards register against concurrent duplicates
+    try:
+        await db["users"].create_index("email", unique=True)
+        _email_index_ok = True
+    except OperationFailure as exc:
+        # Existing duplicate emails or a conflicting index on email
+        logger.error(
+            "Could not create unique index on users.email – duplicate emails "
+            "are only prevented by a racy pre-check until this is fixed: %s",
+            exc,
+        )
+    # Serves the per-user resume list and every userId-scoped lookup
+    try:
+        await db["resumes"].create_index([("userId", 1), ("updatedAt", -1)])
+    except OperationFailure as exc:
+        # e.g. an existing index with different options – not fatal
+        logger.warning("Could not create resumes.userId index: %s", exc)
+
+
+class MongoClientPool:
+    """One Motor client per event loop.
+
+    Motor binds its internal futures to the loop that first uses a client, so
+    sharing a single client between loops (extra workers, test fixtures)
+    stalls.  Clients are created lazily and cached per running loop.  Entries
+    are keyed weakly on the loop object (an id() could be reused by a new
+    loop) and clients of loops that have since closed are dropped.
+    """
+
+    def __init__(self) -> None:
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, AsyncIOMotorClient
+        ] = weakref.WeakKeyDictionary()
+        self._dbs: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, AsyncIOMotorDatabase
+        ] = weakref.WeakKeyDictionary()
+        # asyncio.Lock binds to a single loop, so each loop gets its own.
+        # It serialises lazy (re-)connection so a burst of requests on a cold
+        # process performs a single handshake instead of one per request.
+        self._locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Lock
+        ] = weakref.WeakKeyDictionary()
+
+    def peek(self) -> AsyncIOMotorDatabase | None:
+        """Return the running loop's database handle without connecting."""
+        return self._dbs.get(asyncio.get_running_loop())
+
+    def _prune_closed(self) -> None:
+        for loop, client in list(self._clients.items()):
+            if loop.is_closed():
+                client.close()
+                self._clients.pop(loop, None)
+                self._dbs.pop(loop, None)
+                self._locks.pop(loop, None)
+
+    async def get(self) -> AsyncIOMotorDatabase:
+        loop = asyncio.get_running_loop()
+        db = self._dbs.get(loop)
+        if db is not None:
+            return db
+        lock = self._locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            # Another request may have connected while we waited for the lock
+            db = self._dbs.get(loop)
+            if db is None:
+                self._prune_closed()
+                client, db = await _open_client()
+                try:
+                    await _ensure_indexes(db)
+                except Exception as exc:
+                    # e.g. AutoReconnect right after the ping – don't leak the
+                    # client, and surface it like any other connect failure
+                    client.close()
+                    raise RuntimeError(f"MongoDB index setup failed: {exc}") from exc
+                self._clients[loop] = client
+                self._dbs[loop] = db
+        return db
+
+    def close_all(self) -> int:
+        """Close every cached client; returns how many were closed."""
+        clients = list(self._clients.values())
+        for client in clients:
+            client.close()
+        self._clients.clear()
+        self._dbs.clear()
+        self._locks.clear()
+        return len(clients)
+
+
+_pool = MongoClientPool()
+
+
+async def connect_db() -> None:
+    await _pool.get()
+
+
 async def disconnect_db() -> None:
-    global _client
-    if _client:
-        _client.close()
-        print("MongoDB connection closed")
+    if _pool.close_all():
+        logger.info("MongoDB connection closed")
 
 
 async def ensure_db() -> AsyncIOMotorDatabase:
@@ -78,18 +208,15 @@ async def ensure_db() -> AsyncIOMotorDatabase:
     the whole process lifetime, this helper retries the connection on every
     request that needs the DB until it succeeds.
     """
-    global _db
-    if _db is not None:
-        return _db
-    # Attempt a (re-)connection
-    await connect_db()
-    if _db is None:
-        raise RuntimeError("Database not initialised – connect_db() did not set _db")
-    return _db
+    return await _pool.get()
 
 
 def get_db() -> AsyncIOMotorDatabase:
     """Synchronous accessor – kept for backward compat but prefer ensure_db()."""
-    if _db is None:
+    try:
+        db = _pool.peek()
+    except RuntimeError:
+        db = None  # no running event loop
+    if db is None:
         raise RuntimeError("Database not initialised – call connect_db() first")
-    return _db
+    return db
@@ -0,0 +1,11 @@
+"""
+JWT settings shared by the auth dependency and the auth routes.
+
+Read once at import time, so load_dotenv() must have run before this module
+is imported (see main.py).
+"""
+import os
+
+SECRET_KEY = os.getenv("JWT_SECRET", "your_jwt_secret")
+ALGORITHM = "HS256"
+TOKEN_EXPIRE_SECONDS = 7 * 24 * 60 * 60  # 7 days
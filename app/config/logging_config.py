@@ -0,0 +1,40 @@
+"""
+Non-blocking logging setup.
+
+Handlers only put records on an in-memory queue; a QueueListener thread
+owns the real stderr handler.  Request handlers therefore never block on
+stderr writes, even during an error storm (e.g. while MongoDB is down).
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def configure_logging() -> None:
+    """Route the root logger through a queue (idempotent)."""
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Only merge the traceback into the message here; the listener's
+    # handler applies the real format.
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        handlers=[queue_handler],
+    )
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(_listener.stop)
@@ -6,16 +6,27 @@ Usage:
     async def protected(user_id: str = Depends(get_current_user_id)):
         ...
 """
-import os
+import hashlib
+import time
 
+import jwt
 from fastapi import Depends, Header, HTTPException
-from jose import JWTError, jwt
+from jwt import InvalidTokenError
 
-SECRET_KEY = os.getenv("JWT_SECRET", "your_jwt_secret")
-ALGORITHM = "HS256"
+from app.config.jwt import ALGORITHM, SECRET_KEY
 
+# Verified tokens -> (userId, exp).  Verification is deterministic for a
+# given token and secret, so repeat requests skip the HMAC + JSON decode and
+# only re-check expiry.  Keys are digests to bound memory for long tokens.
+_TOKEN_CACHE: dict[bytes, tuple[str, int]] = {}
+_MAX_CACHE = 4096
 
-def get_current_user_id(authorization: str = Header(default=None)) -> str:
+
+def _cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+async def get_current_user_id(authorization: str = Header(default=None)) -> str:
     """
     Extracts and validates the JWT from the Authorization header.
     Returns the userId claim on success; raises 401 on failure.
@@ -25,11 +36,36 @@ def get_current_user_id(authorization: str = Header(default=None)) -> str:
 
     token = authorization.removeprefix("Bearer ").strip()
 
+    key = _cache_key(token)
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        cached_user_id, cached_exp = cached
+        if cached_exp > time.time():
+            return cached_user_id
+        _TOKEN_CACHE.pop(key, None)
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        # Reject expired tokens (stale clients, replays) before paying for
+        # the HMAC; the full decode below still verifies everything.
+        unverified = jwt.decode(token, options={"verify_signature": False})
+        exp = unverified.get("exp")
+        if isinstance(exp, (int, float)) and exp <= time.time():
+            raise HTTPException(status_code=401, detail="Token is not valid")
+
+        payload = jwt.decode(
+            token,
+            SECRET_KEY,
+            algorithms=[ALGORITHM],
+            options={"require": ["exp", "userId"]},
+        )
         user_id: str | None = payload.get("userId")
         if not user_id:
             raise HTTPException(status_code=401, detail="Token is not valid")
+        exp = payload.get("exp")
+        if isinstance(exp, int):
+            if len(_TOKEN_CACHE) >= _MAX_CACHE:
+                _TOKEN_CACHE.clear()  # simple bounded eviction
+            _TOKEN_CACHE[key] = (user_id, exp)
         return user_id
-    except JWTError:
+    except InvalidTokenError:
         raise HTTPException(status_code=401, detail="Token is not valid")
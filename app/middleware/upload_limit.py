@@ -0,0 +1,35 @@
+"""
+Reject oversized uploads before the request body is read.
+
+By the time a route receives an `UploadFile`, Starlette has already received
+and spooled the whole multipart body, so a size check inside the handler
+only limits what is copied afterwards.  This ASGI middleware checks the
+declared Content-Length first.  Chunked requests without a Content-Length
+still fall through to the in-route check.
+"""
+from fastapi.responses import JSONResponse
+
+# Allowance for multipart boundaries and part headers around the file itself
+_MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    def __init__(self, app, max_file_size: int, paths: tuple[str, ...]) -> None:
+        self.app = app
+        self.max_body = max_file_size + _MULTIPART_OVERHEAD
+        self.max_mb = max_file_size // (1024 * 1024)
+        self.paths = paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.paths):
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body:
+                        response = JSONResponse(
+                            status_code=413,
+                            content={"detail": f"File too large (max {self.max_mb} MB)"},
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
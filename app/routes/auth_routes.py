@@ -8,30 +8,68 @@ POST /api/auth/logout
 POST /api/auth/forgot-password
 POST /api/auth/reset-password
 """
+import asyncio
+import logging
 import os
-import re
 import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from urllib.parse import quote
 
 import aiosmtplib
 import bcrypt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 from bson import ObjectId
+from email_validator import EmailNotValidError, validate_email
 from fastapi import APIRouter, Depends, HTTPException
-from jose import jwt
 from pydantic import BaseModel, field_validator
+from pymongo.errors import DuplicateKeyError
 
 from app.middleware.auth import get_current_user_id
 
-from app.config.database import ensure_db
+from app.config.database import email_index_ready, ensure_db
+from app.config.jwt import ALGORITHM, SECRET_KEY, TOKEN_EXPIRE_SECONDS
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-SECRET_KEY = os.getenv("JWT_SECRET", "your_jwt_secret")
-ALGORITHM = "HS256"
-TOKEN_EXPIRE_SECONDS = 7 * 24 * 60 * 60  # 7 days
+# New hashes use Argon2id; rows created before the switch still hold bcrypt
+# hashes ("$2a$"/"$2b$"/"$2y$") and are verified with bcrypt.
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
+
+# ── Email normalisation ────────────────────────────────────────────────────────
+def _normalize_email(v: str) -> str:
+    """Validate and return the canonical form stored in users.email."""
+    # RFC 5321 caps addresses at 254 chars; reject early so oversized
+    # input never reaches the parser.
+    if len(v) > 254:
+        raise ValueError("Please provide a valid email")
+    try:
+        info = validate_email(v, check_deliverability=False)
+    except EmailNotValidError:
+        raise ValueError("Please provide a valid email")
+    # Stored emails are lower-case; normalized only folds the domain.
+    return info.normalized.lower()
+
+
+def _normalize_lookup_email(v: str) -> str:
+    """Normalise an email used to look a user up, exactly as register stores it.
+
+    Invalid input can't match a stored address, so it is passed through
+    lower-cased rather than rejected – the routes answer as for an unknown
+    email instead of with a validation error.
+    """
+    try:
+        return _normalize_email(v)
+    except ValueError:
+        return v.lower()
 
 
 # ── Pydantic schemas ───────────────────────────────────────────────────────────
@@ -50,25 +88,54 @@ class RegisterRequest(BaseModel):
     @field_validator("email")
     @classmethod
     def email_valid(cls, v: str) -> str:
-        pattern = r"^\w+([\.\-]?\w+)*@\w+([\.\-]?\w+)*(\.\w{2,3})+$"
-        if not re.match(pattern, v):
-            raise ValueError("Please provide a valid email")
-        return v.lower()
+        return _normalize_email(v)
 
 
 class LoginRequest(BaseModel):
     email: str
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def email_normalized(cls, v: str) -> str:
+        return _normalize_lookup_email(v)
+
 
 # ── Helper ─────────────────────────────────────────────────────────────────────
 def _create_token(user_id: str) -> str:
-    payload = {
-        "userId": user_id,
-        "iat": int(datetime.now(timezone.utc).timestamp()),
-        "exp": int(datetime.now(timezone.utc).timestamp()) + TOKEN_EXPIRE_SECONDS,
-    }
-    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    now = int(time.time())
+    return jwt.encode(
+        {"userId": user_id, "iat": now, "exp": now + TOKEN_EXPIRE_SECONDS},
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+
+
+def _verify_password_sync(password: str, hashed: str) -> bool:
+    if hashed.startswith("$2"):
+        return bcrypt.checkpw(password.encode(), hashed.encode())
+    try:
+        return _password_hasher.verify(hashed, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+# Hashing is CPU-bound and deliberately slow, so run it off the event loop –
+# on a small dedicated pool, since each Argon2 call holds 64 MiB and the
+# default executor would allow dozens at once during a login burst.
+_hash_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="password-hash")
+
+
+async def _hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, _password_hasher.hash, password)
+
+
+async def _verify_password(password: str, hashed: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _hash_pool, _verify_password_sync, password, hashed
+    )
 
 
 FREE_TEMPLATES = {"classic", "modern", "ats"}
@@ -76,6 +143,10 @@ PREMIUM_TEMPLATES = {"creative", "minimal", "executive", "sleek", "colorful", "t
 ALL_TEMPLATES = FREE_TEMPLATES | PREMIUM_TEMPLATES
 
 
+# Projection for reads that only feed _serialize_user (_id is implicit)
+_USER_FIELDS = {"name": 1, "email": 1, "plan": 1}
+
+
 def _serialize_user(doc: dict) -> dict:
     return {
         "id": str(doc["_id"]),
@@ -94,26 +165,30 @@ async def register(body: RegisterRequest):
         raise HTTPException(status_code=503, detail="Database not connected")
     users = db["users"]
 
-    # Check duplicate email
-    existing = await users.find_one({"email": body.email.lower()})
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
+    # Normally the unique index rejects duplicates on insert; if it couldn't
+    # be created, fall back to checking first.
+    if not email_index_ready():
+        existing = await users.find_one({"email": body.email}, projection={"_id": 1})
+        if existing:
+            raise HTTPException(status_code=400, detail="Email already registered")
 
-    hashed = bcrypt.hashpw(body.password.encode(), bcrypt.gensalt()).decode()
+    hashed = await _hash_password(body.password)
     now = datetime.now(timezone.utc)
 
-    result = await users.insert_one(
-        {
-            "name": body.name.strip(),
-            "email": body.email.lower(),
-            "password": hashed,
-            "plan": "free",
-            "createdAt": now,
-            "updatedAt": now,
-        }
-    )
-
-    user_doc = await users.find_one({"_id": result.inserted_id})
+    user_doc = {
+        "name": body.name.strip(),
+        "email": body.email,
+        "password": hashed,
+        "plan": "free",
+        "createdAt": now,
+        "updatedAt": now,
+    }
+    try:
+        result = await users.insert_one(user_doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    # Serialise from the local doc instead of re-reading it from MongoDB
+    user_doc["_id"] = result.inserted_id
     token = _create_token(str(result.inserted_id))
 
     return {
@@ -131,11 +206,13 @@ async def login(body: LoginRequest):
         raise HTTPException(status_code=503, detail="Database not connected")
     users = db["users"]
 
-    user_doc = await users.find_one({"email": body.email.lower()})
+    user_doc = await users.find_one(
+        {"email": body.email}, projection={**_USER_FIELDS, "password": 1}
+    )
     if not user_doc:
         raise HTTPException(status_code=400, detail="Invalid credentials")
 
-    if not bcrypt.checkpw(body.password.encode(), user_doc["password"].encode()):
+    if not await _verify_password(body.password, user_doc["password"]):
         raise HTTPException(status_code=400, detail="Invalid credentials")
 
     token = _create_token(str(user_doc["_id"]))
@@ -214,12 +291,22 @@ async def _send_reset_email(to_email: str, reset_link: str) -> None:
 class ForgotPasswordRequest(BaseModel):
     email: str
 
+    @field_validator("email")
+    @classmethod
+    def email_normalized(cls, v: str) -> str:
+        return _normalize_lookup_email(v)
+
 
 class ResetPasswordRequest(BaseModel):
     token: str
     email: str
     newPassword: str
 
+    @field_validator("email")
+    @classmethod
+    def email_normalized(cls, v: str) -> str:
+        return _normalize_lookup_email(v)
+
     @field_validator("newPassword")
     @classmethod
     def password_min_length(cls, v: str) -> str:
@@ -241,7 +328,7 @@ async def get_me(user_id: str = Depends(get_current_user_id)):
         raise HTTPException(status_code=503, detail="Database not connected")
     users = db["users"]
 
-    user_doc = await users.find_one({"_id": ObjectId(user_id)})
+    user_doc = await users.find_one({"_id": ObjectId(user_id)}, projection=_USER_FIELDS)
     if not user_doc:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -261,7 +348,7 @@ async def upgrade_plan(user_id: str = Depends(get_current_user_id)):
         raise HTTPException(status_code=503, detail="Database not connected")
     users = db["users"]
 
-    user_doc = await users.find_one({"_id": ObjectId(user_id)})
+    user_doc = await users.find_one({"_id": ObjectId(user_id)}, projection=_USER_FIELDS)
     if not user_doc:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -269,7 +356,7 @@ async def upgrade_plan(user_id: str = Depends(get_current_user_id)):
         {"_id": ObjectId(user_id)},
         {"$set": {"plan": "premium", "updatedAt": datetime.now(timezone.utc)}},
     )
-    updated = await users.find_one({"_id": ObjectId(user_id)})
+    updated = await users.find_one({"_id": ObjectId(user_id)}, projection=_USER_FIELDS)
     return {"message": "Plan upgraded to premium", "user": _serialize_user(updated)}
 
 
@@ -286,7 +373,7 @@ async def downgrade_plan(user_id: str = Depends(get_current_user_id)):
         {"_id": ObjectId(user_id)},
         {"$set": {"plan": "free", "updatedAt": datetime.now(timezone.utc)}},
     )
-    updated = await users.find_one({"_id": ObjectId(user_id)})
+    updated = await users.find_one({"_id": ObjectId(user_id)}, projection=_USER_FIELDS)
     return {"message": "Plan downgraded to free", "user": _serialize_user(updated)}
 
 
@@ -304,7 +391,7 @@ async def forgot_password(body: ForgotPasswordRequest):
         raise HTTPException(status_code=503, detail="Database not connected")
     users = db["users"]
 
-    user_doc = await users.find_one({"email": body.email.lower()})
+    user_doc = await users.find_one({"email": body.email}, projection={"_id": 1})
     if user_doc:
         token = secrets.token_urlsafe(32)
         expires_at = datetime.now(timezone.utc) + timedelta(minutes=RESET_TOKEN_EXPIRE_MINUTES)
@@ -320,13 +407,18 @@ async def forgot_password(body: ForgotPasswordRequest):
         )
 
         client_url = os.getenv("CLIENT_URL", "http://localhost:5173").split(",")[0].strip()
-        reset_link = f"{client_url}/reset-password?token={token}&email={body.email.lower()}"
+        reset_link = f"{client_url}/reset-password?token={token}&email={quote(body.email)}"
 
         try:
-            await _send_reset_email(body.email.lower(), reset_link)
+            await _send_reset_email(body.email, reset_link)
         except Exception as exc:
-            # Log but don't expose SMTP errors to the client
-            print(f"[forgot-password] Failed to send email to {body.email}: {exc}")
+            # Log but don't expose SMTP errors to the client.  The user id
+            # identifies the account without putting the address in the logs.
+            logger.warning(
+                "Failed to send password-reset email for user %s: %s",
+                user_doc["_id"],
+                exc,
+            )
 
     return {"message": "If that email is registered, a reset link has been sent."}
 
@@ -342,7 +434,10 @@ async def reset_password(body: ResetPasswordRequest):
         raise HTTPException(status_code=503, detail="Database not connected")
     users = db["users"]
 
-    user_doc = await users.find_one({"email": body.email.lower()})
+    user_doc = await users.find_one(
+        {"email": body.email},
+        projection={"passwordResetToken": 1, "passwordResetExpires": 1},
+    )
     if not user_doc:
         raise HTTPException(status_code=400, detail="Invalid or expired reset token")
 
@@ -361,7 +456,7 @@ async def reset_password(body: ResetPasswordRequest):
         if now > expires_at:
             raise HTTPException(status_code=400, detail="Reset token has expired. Please request a new one.")
 
-    hashed = bcrypt.hashpw(body.newPassword.encode(), bcrypt.gensalt()).decode()
+    hashed = await _hash_password(body.newPassword)
 
     await users.update_one(
         {"_id": user_doc["_id"]},
@@ -5,83 +5,220 @@ Document conversion route – mirrors src/routes/convertRoutes.ts +
 POST /api/convert/
     Accepts a .doc or .docx file upload, extracts plain text and returns it.
 
-    .docx: extracted via python-docx (paragraph-by-paragraph)
-    .doc : first converted to .docx with LibreOffice (headless), then same path
+    .docx: word/document.xml streamed with lxml (paragraph-by-paragraph)
+    .doc : first converted to .docx with LibreOffice (headless), then same path;
+           a persistent soffice listener is used when python-uno is available
 """
-import io
+import asyncio
+import logging
 import os
 import shutil
 import subprocess
 import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 from docx import Document
 from fastapi import APIRouter, HTTPException, UploadFile
+from lxml import etree
+
+from app.utils.office_server import DocumentLoadError, office_server
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB guard
+_UPLOAD_CHUNK_SIZE = 64 * 1024
 
+# Conversion and extraction block (LibreOffice round-trip, XML parsing), so
+# they run off the event loop.  Conversion is mostly waiting on soffice and
+# the UNO listener handles one document at a time, hence the small pool.
+# Created on first use, so a later lifespan in the same process (e.g. a
+# reused TestClient) gets fresh pools after shutdown_executors().
+_convert_pool: ThreadPoolExecutor | None = None
+_extract_pool: ThreadPoolExecutor | None = None
 
-def _extract_text_from_docx(buffer: bytes) -> str:
-    """Extract plain text from a .docx buffer using python-docx."""
-    doc = Document(io.BytesIO(buffer))
-    lines: list[str] = []
-    for para in doc.paragraphs:
-        lines.append(para.text)
-    return "\n".join(lines)
 
+def _executors() -> tuple[ThreadPoolExecutor, ThreadPoolExecutor]:
+    global _convert_pool, _extract_pool
+    if _convert_pool is None:
+        _convert_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="convert")
+    if _extract_pool is None:
+        _extract_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="extract")
+    return _convert_pool, _extract_pool
 
-def _convert_doc_to_docx(buffer: bytes) -> bytes:
-    """
-    Convert a legacy .doc buffer to .docx using LibreOffice (headless).
-    Mirrors the libreoffice-convert npm package behaviour.
+
+def shutdown_executors() -> None:
+    """Stop the worker pools (called from the app lifespan on shutdown)."""
+    global _convert_pool, _extract_pool
+    for pool in (_convert_pool, _extract_pool):
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    _convert_pool = _extract_pool = None
+
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY, _W_P, _W_R, _W_T, _W_TAB, _W_BR, _W_CR = (
+    f"{_W}body", f"{_W}p", f"{_W}r", f"{_W}t", f"{_W}tab", f"{_W}br", f"{_W}cr",
+)
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+
+def _extract_text_from_docx(path: str) -> str:
+    """Extract plain text from a .docx file.
+
+    Streams word/document.xml and keeps only run text, so no DOM of styles,
+    runs and relationships is built.  Like python-docx's `doc.paragraphs`,
+    only body-level paragraphs are returned; text in tables and text boxes
+    is left out.  Falls back to python-docx for packages that don't use the
+    standard part name.
     """
+    try:
+        with zipfile.ZipFile(path) as z, z.open("word/document.xml") as f:
+            lines: list[str] = []
+            # One run buffer per open <w:p>.  Paragraphs nested inside a
+            # text box get their own buffer, which is dropped when they end.
+            stack: list[list[str]] = []
+            fallback_depth = 0
+            # Uploaded XML is untrusted: never resolve entities or fetch DTDs
+            # (lxml 4.x resolves external entities by default).
+            for event, el in etree.iterparse(
+                f,
+                events=("start", "end"),
+                tag=(_W_P, _W_T, _W_TAB, _W_BR, _W_CR, _MC_FALLBACK),
+                resolve_entities=False,
+                no_network=True,
+                load_dtd=False,
+            ):
+                if el.tag == _MC_FALLBACK:
+                    # Legacy copy of the preceding <mc:Choice>; never read it
+                    fallback_depth += 1 if event == "start" else -1
+                elif fallback_depth:
+                    continue
+                elif el.tag == _W_P:
+                    if event == "start":
+                        stack.append([])
+                        continue
+                    runs = stack.pop()
+                    parent = el.getparent()
+                    if parent is not None and parent.tag == _W_BODY:
+                        lines.append("".join(runs))
+                        # Free this paragraph and any finished tables before it
+                        el.clear()
+                        while el.getprevious() is not None:
+                            del parent[0]
+                elif event == "start" or not stack:
+                    continue
+                elif el.tag == _W_T:
+                    stack[-1].append(el.text or "")
+                elif el.getparent().tag != _W_R:
+                    continue  # e.g. <w:tab> tab-stop definitions in <w:pPr>
+                elif el.tag == _W_TAB:
+                    stack[-1].append("\t")
+                else:
+                    stack[-1].append("\n")
+            return "\n".join(lines)
+    except KeyError:
+        pass
+
+    doc = Document(path)
+    return "\n".join(para.text for para in doc.paragraphs)
+
+
+def _run_libreoffice_cli(input_path: str, outdir: str) -> None:
+    """One-shot `libreoffice --convert-to docx` (used when UNO is unavailable)."""
     if not shutil.which("libreoffice"):
         raise HTTPException(
             status_code=500,
             detail="Server cannot convert .doc files (libreoffice not found)",
         )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        input_path = os.path.join(tmpdir, "input.doc")
-        with open(input_path, "wb") as f:
-            f.write(buffer)
+    try:
+        subprocess.run(
+            [
+                "libreoffice",
+                "--headless",
+                "--convert-to",
+                "docx",
+                "--outdir",
+                outdir,
+                input_path,
+            ],
+            check=True,
+            capture_output=True,
+            timeout=60,
+        )
+    except subprocess.CalledProcessError as exc:
+        raise HTTPException(
+            status_code=500,
+            detail=f"LibreOffice conversion failed: {exc.stderr.decode(errors='replace')}",
+        )
+    except subprocess.TimeoutExpired:
+        raise HTTPException(
+            status_code=500,
+            detail="LibreOffice conversion timed out",
+        )
 
+
+def _convert_doc_to_docx(input_path: str) -> str:
+    """
+    Convert a legacy .doc file to .docx using LibreOffice (headless).
+    Mirrors the libreoffice-convert npm package behaviour.
+
+    Goes through the persistent UNO listener when available and falls back
+    to spawning LibreOffice for this one file otherwise.  The .docx is
+    written next to the input; its path is returned.
+    """
+    outdir = os.path.dirname(input_path)
+    output_path = os.path.splitext(input_path)[0] + ".docx"
+
+    converted = False
+    if office_server.available():
         try:
-            subprocess.run(
-                [
-                    "libreoffice",
-                    "--headless",
-                    "--convert-to",
-                    "docx",
-                    "--outdir",
-                    tmpdir,
-                    input_path,
-                ],
-                check=True,
-                capture_output=True,
-                timeout=60,
-            )
-        except subprocess.CalledProcessError as exc:
+            office_server.convert_to_docx(input_path, output_path)
+            converted = True
+        except DocumentLoadError:
+            # A broken upload, not a broken listener; the CLI can't do better
             raise HTTPException(
-                status_code=500,
-                detail=f"LibreOffice conversion failed: {exc.stderr.decode(errors='replace')}",
+                status_code=400,
+                detail="LibreOffice could not open the document",
             )
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
+            # The CLI would most likely hang on the same document
             raise HTTPException(
                 status_code=500,
                 detail="LibreOffice conversion timed out",
             )
+        except Exception as exc:
+            logger.warning("UNO conversion failed, using CLI fallback: %s", exc)
+    if not converted:
+        _run_libreoffice_cli(input_path, outdir)
 
-        output_path = os.path.join(tmpdir, "input.docx")
-        if not os.path.exists(output_path):
-            raise HTTPException(
-                status_code=500,
-                detail="LibreOffice did not produce output file",
-            )
+    if not os.path.exists(output_path):
+        raise HTTPException(
+            status_code=500,
+            detail="LibreOffice did not produce output file",
+        )
+    return output_path
 
-        with open(output_path, "rb") as f:
-            return f.read()
+
+async def _save_upload(file: UploadFile, path: str) -> None:
+    """Copy the upload to `path` in chunks, stopping once it exceeds the limit.
+
+    Starlette has already spooled the body by now; requests that declare an
+    oversized Content-Length are rejected earlier by UploadSizeLimitMiddleware.
+    File writes run in a thread so the event loop never blocks on disk I/O.
+    """
+    size = 0
+    f = await asyncio.to_thread(open, path, "wb")
+    try:
+        while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_FILE_SIZE:
+                raise HTTPException(status_code=413, detail="File too large (max 10 MB)")
+            await asyncio.to_thread(f.write, chunk)
+    finally:
+        await asyncio.to_thread(f.close)
 
 
 @router.post("/")
@@ -98,32 +235,38 @@ async def convert_doc(file: UploadFile):
     if ext not in {"doc", "docx"}:
         raise HTTPException(status_code=400, detail="Unsupported file type")
 
-    buffer = await file.read()
-    if len(buffer) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=413, detail="File too large (max 10 MB)")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_path = os.path.join(tmpdir, f"input.{ext}")
+        await _save_upload(file, input_path)
+
+        loop = asyncio.get_running_loop()
+        convert_pool, extract_pool = _executors()
+        docx_path: str
 
-    docx_buffer: bytes
+        if ext == "docx":
+            docx_path = input_path
+        else:
+            # .doc → .docx via LibreOffice
+            try:
+                docx_path = await loop.run_in_executor(
+                    convert_pool, _convert_doc_to_docx, input_path
+                )
+            except HTTPException:
+                raise
+            except Exception as exc:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Server cannot convert .doc files: {exc}",
+                )
 
-    if ext == "docx":
-        docx_buffer = buffer
-    else:
-        # .doc → .docx via LibreOffice
         try:
-            docx_buffer = _convert_doc_to_docx(buffer)
-        except HTTPException:
-            raise
+            text = await loop.run_in_executor(
+                extract_pool, _extract_text_from_docx, docx_path
+            )
         except Exception as exc:
             raise HTTPException(
                 status_code=500,
-                detail=f"Server cannot convert .doc files: {exc}",
+                detail=f"Failed to extract text from document: {exc}",
             )
 
-    try:
-        text = _extract_text_from_docx(docx_buffer)
-    except Exception as exc:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to extract text from document: {exc}",
-        )
-
     return {"text": text}
@@ -10,15 +10,18 @@ GET    /api/resumes/{id}      – get single resume
 PUT    /api/resumes/{id}      – update resume
 DELETE /api/resumes/{id}      – delete resume
 GET    /api/resumes/{id}/download – download (returns resume data + format)
+
+The two GET read endpoints send an ETag derived from updatedAt and answer
+a matching If-None-Match with 304 Not Modified.
 """
-import json
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 from bson import ObjectId
 from bson.errors import InvalidId
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
+from pymongo import ReturnDocument
 
 from app.config.database import ensure_db
 from app.middleware.auth import get_current_user_id
@@ -34,7 +37,7 @@ VALID_SKILL_LEVELS = {"Beginner", "Intermediate", "Advanced", "Expert"}
 async def _get_user_plan(db: Any, user_id: str) -> str:
     """Return the plan ('free' or 'premium') for the given user_id."""
     users = db["users"]
-    doc = await users.find_one({"_id": ObjectId(user_id)})
+    doc = await users.find_one({"_id": ObjectId(user_id)}, projection={"plan": 1})
     return doc.get("plan", "free") if doc else "free"
 
 
@@ -106,14 +109,14 @@ def _to_str_id(oid: Any) -> str:
 
 
 def _serialize_resume(doc: dict) -> dict:
-    """Convert MongoDB document to JSON-serialisable dict."""
+    """Convert MongoDB document to JSON-serialisable dict.
+
+    datetime fields are left as-is; the response class encodes them as ISO
+    8601 strings.
+    """
     doc = dict(doc)
     doc["_id"] = str(doc["_id"])
     doc["userId"] = str(doc["userId"])
-    # Serialise datetime fields
-    for key in ("createdAt", "updatedAt"):
-        if key in doc and isinstance(doc[key], datetime):
-            doc[key] = doc[key].isoformat()
     return doc
 
 
@@ -124,6 +127,39 @@ def _parse_object_id(id_str: str) -> ObjectId:
         raise HTTPException(status_code=400, detail="Invalid resume ID")
 
 
+def _owned_filter(oid: ObjectId, user_id: str) -> dict:
+    """Match a resume only if it belongs to the user.
+
+    Missing and foreign resumes are indistinguishable (both 404), so the API
+    doesn't reveal whether another user's resume ID exists.
+    """
+    return {"_id": oid, "userId": ObjectId(user_id)}
+
+
+_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
+def _to_millis(dt: Optional[datetime]) -> int:
+    if dt is None:
+        return 0
+    # Motor returns naive datetimes that are UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+
+def _not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Attach caching headers; return a 304 if the client's copy is current."""
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
 def _model_to_dict(model: Any) -> dict:
     """Convert a Pydantic model or plain dict to a JSON-serialisable dict.
 
@@ -134,18 +170,11 @@ def _model_to_dict(model: Any) -> dict:
     # If it's already a dict (e.g. received from client as JSON), return as-is
     if isinstance(model, dict):
         return model
-    # If it's a pydantic model (v2), use model_dump_json / model_dump
+    # mode="json" yields JSON-compatible primitives directly, without a
+    # serialise-to-string / parse-back round trip
     if isinstance(model, BaseModel):
-        try:
-            return json.loads(model.model_dump_json(exclude_none=True))
-        except AttributeError:
-            # Fallback for models that implement model_dump instead
-            return model.model_dump(exclude_none=True)
-    # Try to coerce other types
-    try:
-        return json.loads(json.dumps(model))
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid model payload")
+        return model.model_dump(mode="json", exclude_none=True)
+    return model
 
 
 # ── Routes ─────────────────────────────────────────────────────────────────────
@@ -185,23 +214,41 @@ async def create_resume(
     }
 
     result = await resumes.insert_one(doc)
-    created = await resumes.find_one({"_id": result.inserted_id})
+    # Serialise from the local doc instead of re-reading it from MongoDB
+    doc["_id"] = result.inserted_id
 
     return {
         "message": "Resume created successfully",
-        "resume": _serialize_resume(created),
+        "resume": _serialize_resume(doc),
     }
 
 
 @router.get("/")
-async def get_resumes(user_id: str = Depends(get_current_user_id)):
+async def get_resumes(
+    request: Request,
+    response: Response,
+    user_id: str = Depends(get_current_user_id),
+):
     try:
         db = await ensure_db()
     except RuntimeError:
         raise HTTPException(status_code=503, detail="Database not connected")
     resumes = db["resumes"]
-
-    cursor = resumes.find({"userId": ObjectId(user_id)})
+    query = {"userId": ObjectId(user_id)}
+
+    # Cheap pass over the (userId, updatedAt) index for the collection ETag.
+    # The count is part of it because deleting a resume leaves the newest
+    # updatedAt unchanged.
+    count, latest = 0, 0
+    async for doc in resumes.find(query, projection={"_id": 0, "updatedAt": 1}):
+        count += 1
+        latest = max(latest, _to_millis(doc.get("updatedAt")))
+    etag = f'"{count:x}-{latest:x}"'
+    not_modified = _not_modified(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    cursor = resumes.find(query)
     docs = [_serialize_resume(doc) async for doc in cursor]
     return docs
 
@@ -209,6 +256,8 @@ async def get_resumes(user_id: str = Depends(get_current_user_id)):
 @router.get("/{resume_id}")
 async def get_resume(
     resume_id: str,
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
 ):
     try:
@@ -218,12 +267,15 @@ async def get_resume(
     resumes = db["resumes"]
 
     oid = _parse_object_id(resume_id)
-    doc = await resumes.find_one({"_id": oid})
+    doc = await resumes.find_one(_owned_filter(oid, user_id))
 
     if not doc:
         raise HTTPException(status_code=404, detail="Resume not found")
-    if str(doc["userId"]) != user_id:
-        raise HTTPException(status_code=403, detail="Not authorized")
+
+    etag = f'"{_to_millis(doc.get("updatedAt")):x}"'
+    not_modified = _not_modified(request, response, etag)
+    if not_modified is not None:
+        return not_modified
 
     return _serialize_resume(doc)
 
@@ -241,12 +293,6 @@ async def update_resume(
     resumes = db["resumes"]
 
     oid = _parse_object_id(resume_id)
-    doc = await resumes.find_one({"_id": oid})
-
-    if not doc:
-        raise HTTPException(status_code=404, detail="Resume not found")
-    if str(doc["userId"]) != user_id:
-        raise HTTPException(status_code=403, detail="Not authorized")
 
     update_fields: dict[str, Any] = {"updatedAt": datetime.now(timezone.utc)}
 
@@ -254,20 +300,26 @@ async def update_resume(
         update_fields["title"] = body.title.strip()
     if body.personalInfo is not None:
         update_fields["personalInfo"] = _model_to_dict(body.personalInfo)
+    # List items are already plain dicts (schemas type them as list[dict])
     if body.experiences is not None:
-        update_fields["experiences"] = [_model_to_dict(e) for e in body.experiences]
+        update_fields["experiences"] = body.experiences
     if body.education is not None:
-        update_fields["education"] = [_model_to_dict(e) for e in body.education]
+        update_fields["education"] = body.education
     if body.skills is not None:
-        update_fields["skills"] = [_model_to_dict(s) for s in body.skills]
+        update_fields["skills"] = body.skills
     if body.selectedTemplate is not None:
         update_fields["selectedTemplate"] = body.selectedTemplate
         # Enforce plan-based template access on update too
         user_plan = await _get_user_plan(db, user_id)
         _check_template_access(body.selectedTemplate, user_plan)
 
-    await resumes.update_one({"_id": oid}, {"$set": update_fields})
-    updated = await resumes.find_one({"_id": oid})
+    updated = await resumes.find_one_and_update(
+        _owned_filter(oid, user_id),
+        {"$set": update_fields},
+        return_document=ReturnDocument.AFTER,
+    )
+    if not updated:
+        raise HTTPException(status_code=404, detail="Resume not found")
 
     return {
         "message": "Resume updated successfully",
@@ -287,14 +339,10 @@ async def delete_resume(
     resumes = db["resumes"]
 
     oid = _parse_object_id(resume_id)
-    doc = await resumes.find_one({"_id": oid})
-
-    if not doc:
+    result = await resumes.delete_one(_owned_filter(oid, user_id))
+    if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Resume not found")
-    if str(doc["userId"]) != user_id:
-        raise HTTPException(status_code=403, detail="Not authorized")
 
-    await resumes.delete_one({"_id": oid})
     return {"message": "Resume deleted successfully"}
 
 
@@ -311,12 +359,10 @@ async def download_resume(
     resumes = db["resumes"]
 
     oid = _parse_object_id(resume_id)
-    doc = await resumes.find_one({"_id": oid})
+    doc = await resumes.find_one(_owned_filter(oid, user_id))
 
     if not doc:
         raise HTTPException(status_code=404, detail="Resume not found")
-    if str(doc["userId"]) != user_id:
-        raise HTTPException(status_code=403, detail="Not authorized")
 
     return {
         "message": f"Resume download as {format}",
@@ -0,0 +1,216 @@
+"""
+Persistent headless LibreOffice driven over UNO.
+
+Spawning `libreoffice --convert-to` per request pays several seconds of
+start-up each time.  Instead one `soffice` process is kept listening on a
+local socket and documents are converted through it.
+
+python-uno ships with the LibreOffice system package (e.g. apt python3-uno),
+not PyPI, so it is optional: when it can't be imported `available()` is
+False and callers fall back to the per-request subprocess.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+except ImportError:  # pragma: no cover - depends on the system install
+    uno = None
+    PropertyValue = None
+
+logger = logging.getLogger(__name__)
+
+_HOST = "127.0.0.1"
+_CONNECT_TIMEOUT_S = 15.0
+# Same budget the one-shot CLI conversion gets
+_CONVERT_TIMEOUT_S = 60.0
+
+
+class DocumentLoadError(Exception):
+    """LibreOffice is running but could not open the input document."""
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((_HOST, 0))
+        return sock.getsockname()[1]
+
+
+def _props(**kwargs) -> tuple:
+    values = []
+    for name, value in kwargs.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        values.append(prop)
+    return tuple(values)
+
+
+class OfficeServer:
+    """Owns the background soffice process and its UNO desktop handle.
+
+    Every worker process runs its own listener on its own port and profile.
+    soffice instances sharing a profile hand their work to the first one,
+    which would defeat the per-process lock and let one worker's restart
+    kill another's listener.  The separate profile also keeps it clear of
+    ad-hoc `libreoffice --convert-to` runs using the default profile.
+    """
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen | None = None
+        self._desktop = None
+        self._accept = ""
+        # The UNO bridge is not thread-safe; one conversion at a time.
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _profile_dir() -> Path:
+        return Path(tempfile.gettempdir()) / f"rb_soffice_profile_{os.getpid()}"
+
+    @staticmethod
+    def _binary() -> str | None:
+        return shutil.which("soffice") or shutil.which("libreoffice")
+
+    def available(self) -> bool:
+        return uno is not None and self._binary() is not None
+
+    def start(self) -> None:
+        """Launch the listener if it isn't already running (non-blocking)."""
+        if not self.available():
+            return
+        if self._proc is not None and self._proc.poll() is None:
+            return
+        self._desktop = None
+        port = _free_port()
+        self._accept = f"socket,host={_HOST},port={port};urp;"
+        profile_dir = self._profile_dir()
+        self._proc = subprocess.Popen(
+            [
+                self._binary(),
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nofirststartwizard",
+                f"-env:UserInstallation={profile_dir.as_uri()}",
+                f"--accept={self._accept}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        logger.info(
+            "LibreOffice listener started (pid %d, port %d)", self._proc.pid, port
+        )
+
+    def stop(self) -> None:
+        self._desktop = None
+        if self._proc is None:
+            return
+        if self._proc.poll() is None:
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+        self._proc = None
+        shutil.rmtree(self._profile_dir(), ignore_errors=True)
+        logger.info("LibreOffice listener stopped")
+
+    def _connect(self):
+        """Return a Desktop, waiting for the listener to accept connections."""
+        if self._desktop is not None:
+            return self._desktop
+        self.start()
+        local_ctx = uno.getComponentContext()
+        resolver = local_ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_ctx
+        )
+        deadline = time.monotonic() + _CONNECT_TIMEOUT_S
+        while True:
+            try:
+                ctx = resolver.resolve(f"uno:{self._accept}StarOffice.ComponentContext")
+                break
+            except Exception:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.25)
+        self._desktop = ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", ctx
+        )
+        return self._desktop
+
+    def ping(self) -> None:
+        """Block until the listener is accepting UNO connections."""
+        with self._lock:
+            self._connect()
+
+    def _convert_once(self, input_path: str, output_path: str) -> None:
+        # Watchdog: a document that hangs soffice would otherwise hold the
+        # lock forever.  Killing the process makes the pending UNO call fail.
+        timed_out = threading.Event()
+
+        def _kill() -> None:
+            timed_out.set()
+            proc = self._proc
+            if proc is not None and proc.poll() is None:
+                proc.kill()
+
+        timer = threading.Timer(_CONVERT_TIMEOUT_S, _kill)
+        timer.daemon = True
+        timer.start()
+        try:
+            desktop = self._connect()
+            doc = desktop.loadComponentFromURL(
+                Path(input_path).as_uri(), "_blank", 0, _props(Hidden=True)
+            )
+            if doc is None:
+                raise DocumentLoadError("LibreOffice could not open the document")
+            try:
+                doc.storeToURL(
+                    Path(output_path).as_uri(), _props(FilterName="MS Word 2007 XML")
+                )
+            finally:
+                doc.close(True)
+        except Exception:
+            if timed_out.is_set():
+                raise TimeoutError("LibreOffice conversion timed out") from None
+            raise
+        finally:
+            timer.cancel()
+
+    def convert_to_docx(self, input_path: str, output_path: str) -> None:
+        """Convert `input_path` to .docx at `output_path`.
+
+        A dropped bridge or crashed process is respawned and the conversion
+        retried once before the error is raised.  A conversion that exceeds
+        the timeout kills the listener and raises TimeoutError without a
+        retry; the next call starts a fresh listener.  A document that
+        LibreOffice can't open raises DocumentLoadError and leaves the
+        listener running.
+        """
+        with self._lock:
+            try:
+                self._convert_once(input_path, output_path)
+            except DocumentLoadError:
+                raise
+            except TimeoutError:
+                self.stop()
+                raise
+            except Exception as exc:
+                logger.warning("LibreOffice UNO conversion failed, restarting: %s", exc)
+                self.stop()
+                self._convert_once(input_path, output_path)
+
+
+office_server = OfficeServer()
@@ -1,53 +1,95 @@
+import asyncio
+import logging
 import os
-import traceback
+import sys
+import time
 from contextlib import asynccontextmanager
 
 # load_dotenv() MUST run before any app.* imports so that modules which read
-# env vars at import time (e.g. JWT_SECRET in auth.py / auth_routes.py) pick
-# up the values from .env.
+# env vars at import time (e.g. JWT_SECRET in app/config/jwt.py) pick up the
+# values from .env.
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from fastapi import FastAPI, HTTPException, Request  # noqa: E402
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
-from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
 
-from app.config.database import connect_db, disconnect_db  # noqa: E402
+from app.config.database import disconnect_db, ensure_db  # noqa: E402
+from app.config.logging_config import configure_logging  # noqa: E402
 from app.routes.auth_routes import router as auth_router  # noqa: E402
+from app.middleware.upload_limit import UploadSizeLimitMiddleware  # noqa: E402
+from app.routes.convert_routes import MAX_FILE_SIZE  # noqa: E402
 from app.routes.convert_routes import router as convert_router  # noqa: E402
+from app.routes.convert_routes import shutdown_executors  # noqa: E402
 from app.routes.parse_resume_routes import router as parse_resume_router  # noqa: E402
 from app.routes.resume_routes import router as resume_router  # noqa: E402
+from app.utils.office_server import office_server  # noqa: E402
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+async def _warm_db() -> None:
+    """Connect and run a cheap query so the first request finds a warm pool."""
+    start = time.perf_counter()
+    db = await ensure_db()
+    await db["users"].estimated_document_count()
+    logger.info("MongoDB warm-up took %.2fs", time.perf_counter() - start)
+
+
+async def _warm_libreoffice() -> None:
+    """Start the LibreOffice listener and wait until it accepts connections."""
+    if not office_server.available():
+        return
+    start = time.perf_counter()
+    office_server.start()
+    await asyncio.wait_for(asyncio.to_thread(office_server.ping), timeout=15)
+    logger.info("LibreOffice warm-up took %.2fs", time.perf_counter() - start)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Connect to DB but don't fail the whole app startup if connection fails.
-    # Some hosting environments can cause transient TLS/network errors during
-    # startup; allow the app to start so the process binds the port and logs
-    # the underlying error for debugging.
-    _connected = False
-    try:
-        await connect_db()
-        _connected = True
-    except Exception as exc:
-        # Print full traceback to logs so Render/hosting shows the root cause.
-        import traceback
-
-        print("Warning: failed to connect to MongoDB during startup:", exc)
-        traceback.print_exc()
+    # Warm MongoDB and LibreOffice concurrently so the first requests after a
+    # cold start (Render spins idle instances down) don't pay for either.
+    # Neither failure is fatal: some hosting environments cause transient
+    # TLS/network errors during startup, so let the app bind the port, log
+    # the underlying error and rely on ensure_db() to reconnect later.
+    db_result, office_result = await asyncio.gather(
+        _warm_db(), _warm_libreoffice(), return_exceptions=True
+    )
+    if isinstance(db_result, BaseException):
+        # Log full traceback so Render/hosting shows the root cause.
+        logger.error(
+            "Failed to connect to MongoDB during startup", exc_info=db_result
+        )
+    if isinstance(office_result, BaseException):
+        logger.error(
+            "Failed to warm up LibreOffice listener", exc_info=office_result
+        )
 
     try:
         yield
     finally:
-        if _connected:
-            try:
-                await disconnect_db()
-            except Exception:
-                pass
-
-
-app = FastAPI(title="Resume Builder API", version="1.0.0", lifespan=lifespan)
+        shutdown_executors()
+        office_server.stop()
+        # No-op when nothing connected; also closes clients opened lazily
+        # by ensure_db() after a failed startup connect.
+        try:
+            await disconnect_db()
+        except Exception:
+            pass
+
+
+# orjson encodes route return values (incl. datetimes) much faster than the
+# stdlib json module used by the default JSONResponse.
+app = FastAPI(
+    title="Resume Builder API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # CORS middleware – allow one or more client origins.
 # Read `CLIENT_URL` from env; support comma-separated values for multiple
@@ -58,6 +100,14 @@ _origins = [o.strip() for o in _origins_env.split(",") if o.strip()]
 if "https://rb-client.vercel.app" not in _origins:
     _origins.append("https://rb-client.vercel.app")
 
+# Reject oversized uploads from Content-Length before the body is spooled.
+# Added before CORS so the 413 still carries CORS headers.
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_file_size=MAX_FILE_SIZE,
+    paths=("/api/convert", "/api/parse-resume"),
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_origins,
@@ -84,8 +134,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     if isinstance(exc, HTTPException):
         raise exc
     # Log the real error so it's visible in Render / hosting logs
-    print(f"Unhandled exception on {request.method} {request.url.path}: {exc}")
-    traceback.print_exc()
+    logger.exception("Unhandled exception on %s %s", request.method, request.url.path)
     return JSONResponse(status_code=500, content={"message": "Internal server error"})
 
 
@@ -93,4 +142,17 @@ if __name__ == "__main__":
     import uvicorn
 
     port = int(os.getenv("PORT", 5000))
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
+    # uvloop / httptools ship with uvicorn[standard]; uvloop has no Windows
+    # build.  For auto-reload during development run uvicorn directly (see
+    # README) – reload forces a single worker and adds a file watcher.
+    # One worker unless WEB_CONCURRENCY says otherwise: os.cpu_count() reports
+    # the host's cores, not the container's CPU quota, and each worker adds
+    # its own DB pool, LibreOffice listener and Argon2 memory.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
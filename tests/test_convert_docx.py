@@ -0,0 +1,71 @@
+"""
+Text extraction from .docx uploads (app/routes/convert_routes.py).
+
+The fixture is a hand-built document.xml holding the shapes Word writes
+for text boxes (mc:AlternateContent with a DrawingML Choice and a VML
+Fallback) and tables; the expected output matches python-docx's
+`doc.paragraphs`, which the streaming extractor replaced.
+"""
+import zipfile
+
+import pytest
+
+pytest.importorskip("lxml")
+pytest.importorskip("docx")
+pytest.importorskip("fastapi")
+
+from app.routes.convert_routes import _extract_text_from_docx  # noqa: E402
+
+_DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document
+    xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+    xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+    xmlns:v="urn:schemas-microsoft-com:vml">
+  <w:body>
+    <w:p>
+      <w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr>
+      <w:r><w:t xml:space="preserve">Name </w:t></w:r>
+      <w:r>
+        <mc:AlternateContent>
+          <mc:Choice Requires="wps">
+            <w:drawing><wps:txbx><w:txbxContent>
+              <w:p><w:r><w:t>Box text</w:t></w:r></w:p>
+            </w:txbxContent></wps:txbx></w:drawing>
+          </mc:Choice>
+          <mc:Fallback>
+            <w:pict><v:textbox><w:txbxContent>
+              <w:p><w:r><w:t>Box text</w:t></w:r></w:p>
+            </w:txbxContent></v:textbox></w:pict>
+          </mc:Fallback>
+        </mc:AlternateContent>
+      </w:r>
+      <w:r><w:t>Tail</w:t></w:r>
+    </w:p>
+    <w:tbl>
+      <w:tr><w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p></w:tc></w:tr>
+    </w:tbl>
+    <w:p><w:r><w:t>A</w:t><w:tab/><w:t>B</w:t><w:br/><w:t>C</w:t></w:r></w:p>
+    <w:p/>
+  </w:body>
+</w:document>
+"""
+
+
+@pytest.fixture
+def docx_path(tmp_path):
+    path = tmp_path / "fixture.docx"
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("word/document.xml", _DOCUMENT_XML)
+    return str(path)
+
+
+def test_text_box_and_table_text_are_not_emitted(docx_path):
+    lines = _extract_text_from_docx(docx_path).split("\n")
+    assert lines[0] == "Name Tail"
+    assert "Box text" not in lines
+    assert "Cell" not in lines
+
+
+def test_run_breaks_and_empty_paragraphs(docx_path):
+    assert _extract_text_from_docx(docx_path) == "Name Tail\nA\tB\nC\n"